@@ -74,3 +74,15 @@ def test_extra_suffixes() -> None:
         netloc = "www.foo.bar.baz.quux" + "." + custom_suffix
         result = extract_using_extra_suffixes(netloc)
         assert result.suffix == custom_suffix
+
+
+def test_extra_suffixes_case_insensitive() -> None:
+    """Test extra suffixes are matched regardless of case."""
+    extract_using_uppercase_extra_suffixes = tldextract.TLDExtract(
+        cache_dir=None,
+        suffix_list_urls=[FAKE_SUFFIX_LIST_URL],
+        extra_suffixes=[suffix.upper() for suffix in EXTRA_SUFFIXES],
+    )
+    for custom_suffix in EXTRA_SUFFIXES:
+        result = extract_using_uppercase_extra_suffixes("www.Foo." + custom_suffix)
+        assert result.suffix == custom_suffix
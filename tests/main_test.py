@@ -4,7 +4,11 @@ from __future__ import annotations
 
 import logging
 import os
+import pickle
+import pkgutil
+import platform
 import tempfile
+import weakref
 from collections.abc import Sequence
 from pathlib import Path
 from typing import Any
@@ -150,6 +154,9 @@ def test_lenient_netloc() -> None:
         )
         == "[aBcD:ef01:2345:6789:aBcD:ef01:127\uff0e0\u30020\uff611]"
     )
+    assert lenient_netloc("example.com.ca") == "example.com.ca"
+    assert lenient_netloc(" example.com.ca.\u3002 ") == "example.com.ca"
+    assert lenient_netloc("[example.com.ca]x") == "[example.com.ca]"
 
 
 def test_looks_like_ip() -> None:
@@ -488,6 +495,46 @@ def test_find_first_response_with_session(tmp_path: Path) -> None:
     mock_session.close.assert_not_called()
 
 
+def test_extract_tlds_from_suffix_list() -> None:
+    """Test parsing rules, comments, and whitespace out of suffix list text."""
+    suffix_list_text = (
+        "// ===BEGIN ICANN DOMAINS===\n"
+        "\n"
+        "com\n"
+        "*.ck\n"
+        "!www.ck\tcomment after whitespace\n"
+        "  indented lines are not rules\n"
+        "*\n"
+        "#x\n"
+        "-foo\n"
+        "/x\n"
+        "a\x0bb\n"
+        "c\u2028d\n"
+        "// ===BEGIN PRIVATE DOMAINS===\r\n"
+        "blogspot.com\r\n"
+    )
+    assert tldextract.suffix_list.extract_tlds_from_suffix_list(suffix_list_text) == (
+        ["com", "*.ck", "!www.ck", "a", "c"],
+        ["blogspot.com"],
+    )
+    assert [
+        match.group("suffix")
+        for match in tldextract.suffix_list.PUBLIC_SUFFIX_RE.finditer(suffix_list_text)
+    ] == ["com", "*.ck", "!www.ck", "a", "c", "blogspot.com"]
+
+
+def test_snapshot_parsed_once(mocker: pytest_mock.MockerFixture) -> None:
+    """Test extractors falling back to the snapshot share one parse of it."""
+    tldextract.suffix_list._get_snapshot_suffix_lists.cache_clear()
+    get_data = mocker.spy(pkgutil, "get_data")
+
+    for _ in range(2):
+        my_extract = tldextract.TLDExtract(cache_dir=None, suffix_list_urls=())
+        assert my_extract("foo.co.uk") == ExtractResult("", "foo", "co.uk", False)
+
+    assert get_data.call_count == 1
+
+
 def test_include_psl_private_domain_attr() -> None:
     """Test private domains, which default to not being treated differently."""
     extract_private = tldextract.TLDExtract(include_psl_private_domains=True)
@@ -606,6 +653,16 @@ def test_private_domains_depth() -> None:
         subdomain="", domain="", suffix="icann.compute.amazonaws.com", is_private=True
     )
 
+    # Private suffix which is also a prefix of longer private suffixes
+    assert tldextract.extract(
+        "foo.dualstack.us-east-1.amazonaws.com", include_psl_private_domains=True
+    ) == ExtractResult(
+        subdomain="foo",
+        domain="dualstack",
+        suffix="us-east-1.amazonaws.com",
+        is_private=True,
+    )
+
     # Entire URL is private suffix which ends with another private suffix
     # i.e. "s3.dualstack.us-east-1.amazonaws.com" ends with "us-east-1.amazonaws.com"
     assert tldextract.extract(
@@ -616,3 +673,61 @@ def test_private_domains_depth() -> None:
         suffix="s3.dualstack.us-east-1.amazonaws.com",
         is_private=True,
     )
+
+
+def test_netloc_cache() -> None:
+    """Test repeated hostnames reuse a split, without sharing result objects."""
+    extract_cached = tldextract.TLDExtract(cache_dir=None, suffix_list_urls=())
+    first = extract_cached("http://www.google.com")
+    second = extract_cached("https://www.google.com/path")
+    assert first == second
+    assert first is not second
+    assert extract_cached._split_netloc.cache_info().hits == 1
+
+    extract_cached.update()
+    assert extract_cached._split_netloc.cache_info().currsize == 0
+
+
+def test_netloc_cache_disabled() -> None:
+    """Test the in-memory hostname cache can be turned off."""
+    extract_uncached = tldextract.TLDExtract(
+        cache_dir=None, suffix_list_urls=(), netloc_cache_size=0
+    )
+    assert extract_uncached("www.google.com") == extract_uncached("www.google.com")
+    assert extract_uncached._split_netloc.cache_info().currsize == 0
+
+
+@pytest.mark.skipif(
+    platform.python_implementation() != "CPython",
+    reason="relies on reference counting",
+)
+def test_netloc_cache_no_reference_cycle() -> None:
+    """Test an extractor is freed as soon as its last reference is dropped."""
+    extract_dropped = tldextract.TLDExtract(cache_dir=None, suffix_list_urls=())
+    extract_dropped("http://www.google.com")
+    extract_ref = weakref.ref(extract_dropped)
+
+    del extract_dropped
+    assert extract_ref() is None
+
+
+def test_extract_result_is_a_plain_object() -> None:
+    """Test results support weak references, extra attributes, and pickling."""
+    result = tldextract.extract("http://www.google.com")
+    assert weakref.ref(result)() is result
+
+    result.note = "extra"  # type: ignore[attr-defined]
+    unpickled = pickle.loads(pickle.dumps(result))
+    assert unpickled == result
+    assert unpickled.note == "extra"
+
+
+def test_pickle_extractor(mocker: pytest_mock.MockerFixture) -> None:
+    """Test a pickled extractor keeps its suffix list, without refetching it."""
+    extract_pickled = tldextract.TLDExtract(cache_dir=None, suffix_list_urls=())
+    expected = extract_pickled("http://www.google.com")
+
+    get_suffix_lists = mocker.spy(tldextract.tldextract, "get_suffix_lists")
+    extract_unpickled = pickle.loads(pickle.dumps(extract_pickled))
+    assert extract_unpickled("http://www.google.com") == expected
+    assert get_suffix_lists.call_count == 0
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+import stat
 import sys
 import types
 from collections.abc import Hashable
@@ -30,6 +32,39 @@ def test_disk_cache(tmp_path: Path) -> None:
     assert cache.get("testing", "foo") == "baz"
 
 
+def test_disk_cache_set_replaces_file(tmp_path: Path) -> None:
+    """Test DiskCache writes each entry to a single file, overwritten in place."""
+    cache = DiskCache(str(tmp_path))
+    cache.set("testing", "foo", "bar")
+    cache.set("testing", "foo", "baz")
+
+    assert cache.get("testing", "foo") == "baz"
+    assert len(list(Path(tmp_path, "testing").iterdir())) == 1
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permission bits")
+def test_disk_cache_set_respects_umask(tmp_path: Path) -> None:
+    """Test DiskCache entries get the usual umask-derived mode, e.g. for shared caches."""
+    old_umask = os.umask(0o022)
+    try:
+        cache = DiskCache(str(tmp_path))
+        cache.set("testing", "foo", "bar")
+    finally:
+        os.umask(old_umask)
+
+    (entry,) = Path(tmp_path, "testing").iterdir()
+    assert stat.S_IMODE(entry.stat().st_mode) == 0o644
+
+
+def test_disk_cache_set_unserializable(tmp_path: Path) -> None:
+    """Test DiskCache leaves no temporary file behind when a value can't be written."""
+    cache = DiskCache(str(tmp_path))
+    with pytest.raises(TypeError):
+        cache.set("testing", "foo", object())
+
+    assert list(Path(tmp_path, "testing").iterdir()) == []
+
+
 def test_get_pkg_unique_identifier(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test generating a unique identifier for the version of this package."""
     monkeypatch.setattr(sys, "version_info", (3, 9, 1, "final", 0))
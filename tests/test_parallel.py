@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from multiprocessing import Pool
 from pathlib import Path
 
 import pytest
+import pytest_mock
 import responses
 
+import tldextract.tldextract
 from tldextract import TLDExtract
 from tldextract.tldextract import PUBLIC_SUFFIX_LIST_URLS
 
@@ -55,3 +58,14 @@ def test_cache_cleared_by_other_process(
     monkeypatch.setattr(os, "unlink", evil_unlink)
 
     extract.update(fetch_now=True)
+
+
+def test_threads_build_one_extractor(mocker: pytest_mock.MockerFixture) -> None:
+    """Ensure concurrent first calls in one process parse the suffix list once."""
+    get_suffix_lists = mocker.spy(tldextract.tldextract, "get_suffix_lists")
+    extract = TLDExtract(cache_dir=None, suffix_list_urls=())
+    thread_count = 8
+    with ThreadPoolExecutor(max_workers=thread_count) as executor:
+        results = list(executor.map(extract, ["www.google.com"] * thread_count))
+    assert {result.registered_domain for result in results} == {"google.com"}
+    assert get_suffix_lists.call_count == 1
@@ -2,7 +2,7 @@
 
 from itertools import permutations
 
-from tldextract.tldextract import Trie
+from tldextract.tldextract import Trie, _PublicSuffixListTLDExtractor
 
 
 def test_nested_dict() -> None:
@@ -45,3 +45,31 @@ def test_nested_dict() -> None:
         d_to_f = top_d.matches["f"]
         assert d_to_f.end
         assert not d_to_f.matches
+
+
+def test_public_and_private_suffix() -> None:
+    """Test a suffix listed as both public and private is treated as public."""
+    trie = Trie.create(["com", "example.com"], ["example.com", "private.com"])
+    top_com = trie.matches["com"]
+    assert top_com.end
+    assert not top_com.is_private
+    assert top_com.matches["example"].end
+    assert not top_com.matches["example"].is_private
+    assert top_com.matches["private"].end
+    assert top_com.matches["private"].is_private
+
+
+def test_private_branch_excluded_from_public_lookup() -> None:
+    """Test a private rule under a public wildcard doesn't hide the wildcard."""
+    extractor = _PublicSuffixListTLDExtractor(["*.ck", "!www.ck"], ["foo.ck"], [])
+    assert extractor.suffix_index(["www", "foo", "ck"]) == (1, False)
+    assert extractor.suffix_index(
+        ["www", "foo", "ck"], include_psl_private_domains=True
+    ) == (1, True)
+    assert extractor.suffix_index(["www", "ck"]) == (1, False)
+
+    extractor = _PublicSuffixListTLDExtractor(["*.jp"], ["x.y.jp"], [])
+    assert extractor.suffix_index(["a", "z", "y", "jp"]) == (2, False)
+    assert extractor.suffix_index(
+        ["a", "x", "y", "jp"], include_psl_private_domains=True
+    ) == (1, True)
@@ -8,6 +8,7 @@ import json
 import logging
 import os
 import sys
+import uuid
 from collections.abc import Callable, Hashable, Iterable
 from pathlib import Path
 from typing import (
@@ -100,7 +101,8 @@ class DiskCache:
         if not os.path.isfile(cache_filepath):
             raise KeyError("namespace: " + namespace + " key: " + repr(key))
         try:
-            with open(cache_filepath) as cache_file:
+            # json.dump escapes non-ASCII, so skip the text decoding layer
+            with open(cache_filepath, "rb") as cache_file:
                 return json.load(cache_file)
         except (OSError, ValueError) as exc:
             raise KeyError("namespace: " + namespace + " key: " + repr(key)) from exc
@@ -116,8 +118,21 @@ class DiskCache:
 
         try:
             _make_dir(cache_filepath)
-            with open(cache_filepath, "w") as cache_file:
-                json.dump(value, cache_file)
+            # Write to a sibling file, then swap it in, so readers never see
+            # a partially written entry. Keep the extension so `.clear()`
+            # also removes leftovers from an interrupted write.
+            tmp_filepath = (
+                cache_filepath[: -len(self.file_ext)]
+                + f".{uuid.uuid4().hex}.tmp"
+                + self.file_ext
+            )
+            try:
+                with open(tmp_filepath, "w") as cache_file:
+                    json.dump(value, cache_file)
+                os.replace(tmp_filepath, cache_filepath)
+            finally:
+                if os.path.exists(tmp_filepath):
+                    os.unlink(tmp_filepath)
         except OSError as ioe:
             global _DID_LOG_UNABLE_TO_CACHE
             if not _DID_LOG_UNABLE_TO_CACHE:
@@ -232,9 +247,4 @@ def _make_cache_key(inputs: str | dict[str, Hashable]) -> str:
 
 def _make_dir(filename: str) -> None:
     """Make a directory if it doesn't already exist."""
-    if not os.path.exists(os.path.dirname(filename)):
-        try:
-            os.makedirs(os.path.dirname(filename))
-        except OSError as exc:  # Guard against race condition
-            if exc.errno != errno.EEXIST:
-                raise
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
@@ -22,6 +22,12 @@ def lenient_netloc(url: str) -> str:
     urllib.parse.{urlparse,urlsplit}, but extract more leniently, without
     raising errors.
     """
+    if not (
+        "/" in url or ":" in url or "@" in url or "?" in url or "#" in url or "[" in url
+    ):
+        # Fast path for bare hostnames, e.g. a list of domains
+        return url.strip().rstrip(".\u3002\uff0e\uff61")
+
     after_userinfo = (
         _schemeless_url(url)
         .partition("/")[0]
@@ -47,7 +53,7 @@ def _schemeless_url(url: str) -> str:
     if (
         double_slashes_start < 2
         or url[double_slashes_start - 1] != ":"
-        or set(url[: double_slashes_start - 1]) - scheme_chars_set
+        or not scheme_chars_set.issuperset(url[: double_slashes_start - 1])
     ):
         return url
     return url[double_slashes_start + 2 :]
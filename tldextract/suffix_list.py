@@ -6,6 +6,7 @@ import logging
 import pkgutil
 import re
 from collections.abc import Sequence
+from functools import lru_cache
 from typing import cast
 
 import requests
@@ -15,6 +16,7 @@ from .cache import DiskCache
 
 LOG = logging.getLogger("tldextract")
 
+# No longer used for parsing, see `_parse_suffixes`. Kept for compatibility.
 PUBLIC_SUFFIX_RE = re.compile(r"^(?P<suffix>[.*!]*\w[\S]*)", re.UNICODE | re.MULTILINE)
 PUBLIC_PRIVATE_SUFFIX_SEPARATOR = "// ===BEGIN PRIVATE DOMAINS==="
 
@@ -67,11 +69,28 @@ def extract_tlds_from_suffix_list(suffix_list_text: str) -> tuple[list[str], lis
         PUBLIC_PRIVATE_SUFFIX_SEPARATOR
     )
 
-    public_tlds = [m.group("suffix") for m in PUBLIC_SUFFIX_RE.finditer(public_text)]
-    private_tlds = [m.group("suffix") for m in PUBLIC_SUFFIX_RE.finditer(private_text)]
+    public_tlds = _parse_suffixes(public_text)
+    private_tlds = _parse_suffixes(private_text)
     return public_tlds, private_tlds
 
 
+def _parse_suffixes(text: str) -> list[str]:
+    """Read each rule up to its first whitespace, skipping blanks and comments.
+
+    A line is a rule if, after any leading `.`, `*` or `!`, it starts with a
+    word character. Only newlines end a line, as in the PSL format.
+    """
+    suffixes = []
+    for line in text.split("\n"):
+        if not line or line[0].isspace():
+            continue
+        suffix = line.split(maxsplit=1)[0]
+        name = suffix.lstrip(".*!")
+        if name and (name[0].isalnum() or name[0] == "_"):
+            suffixes.append(suffix)
+    return suffixes
+
+
 def get_suffix_lists(
     cache: DiskCache,
     urls: Sequence[str],
@@ -108,13 +127,24 @@ def _get_suffix_lists(
         )
     except SuffixListNotFound as exc:
         if fallback_to_snapshot:
-            maybe_pkg_data = pkgutil.get_data("tldextract", ".tld_set_snapshot")
-            # package maintainers guarantee file is included
-            pkg_data = cast(bytes, maybe_pkg_data)
-            text = pkg_data.decode("utf-8")
-        else:
-            raise exc
+            public_snapshot, private_snapshot = _get_snapshot_suffix_lists()
+            return list(public_snapshot), list(private_snapshot)
+        raise exc
 
     public_tlds, private_tlds = extract_tlds_from_suffix_list(text)
 
     return public_tlds, private_tlds
+
+
+@lru_cache(maxsize=1)
+def _get_snapshot_suffix_lists() -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Read and parse the bundled snapshot once per process.
+
+    The snapshot never changes at runtime, so every extractor falling back to
+    it can share the parse. Tuples keep the shared copy from being mutated.
+    """
+    maybe_pkg_data = pkgutil.get_data("tldextract", ".tld_set_snapshot")
+    # package maintainers guarantee file is included
+    pkg_data = cast(bytes, maybe_pkg_data)
+    public_tlds, private_tlds = extract_tlds_from_suffix_list(pkg_data.decode("utf-8"))
+    return tuple(public_tlds), tuple(private_tlds)
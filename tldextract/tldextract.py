@@ -37,10 +37,13 @@ To rejoin the original hostname, if it was indeed a valid, registered hostname:
 from __future__ import annotations
 
 import os
+import threading
 import urllib.parse
+import weakref
 from collections.abc import Collection, Sequence
 from dataclasses import dataclass
-from functools import wraps
+from functools import _lru_cache_wrapper, lru_cache, wraps
+from typing import cast
 
 import idna
 import requests
@@ -51,6 +54,8 @@ from .suffix_list import get_suffix_lists
 
 CACHE_TIMEOUT = os.environ.get("TLDEXTRACT_CACHE_TIMEOUT")
 
+NETLOC_CACHE_SIZE = 4096
+
 PUBLIC_SUFFIX_LIST_URLS = (
     "https://publicsuffix.org/list/public_suffix_list.dat",
     "https://raw.githubusercontent.com/publicsuffix/list/master/public_suffix_list.dat",
@@ -138,6 +143,27 @@ class ExtractResult:
         return ""
 
 
+def _make_netloc_cache(
+    extract: TLDExtract, maxsize: int
+) -> _lru_cache_wrapper[tuple[str, str, str, bool]]:
+    """Memoize an extractor's netloc splits, without a strong reference to it.
+
+    Caching the bound method would make every instance a reference cycle, so
+    its trie would only be freed by the cyclic garbage collector.
+    """
+    extract_ref = weakref.ref(extract)
+
+    @lru_cache(maxsize=maxsize)
+    def split_netloc(
+        netloc: str, include_psl_private_domains: bool | None
+    ) -> tuple[str, str, str, bool]:
+        return cast(TLDExtract, extract_ref())._split_netloc_uncached(
+            netloc, include_psl_private_domains
+        )
+
+    return split_netloc
+
+
 class TLDExtract:
     """A callable for extracting, subdomain, domain, and suffix components from a URL."""
 
@@ -150,6 +176,7 @@ class TLDExtract:
         include_psl_private_domains: bool = False,
         extra_suffixes: Sequence[str] = (),
         cache_fetch_timeout: str | float | None = CACHE_TIMEOUT,
+        netloc_cache_size: int = NETLOC_CACHE_SIZE,
     ) -> None:
         """Construct a callable for extracting subdomain, domain, and suffix components from a URL.
 
@@ -191,6 +218,10 @@ class TLDExtract:
 
         When set this way, the same timeout value will be used for both connect
         and read timeouts
+
+        The results of splitting the most recently seen `netloc_cache_size`
+        hostnames are kept in memory, so repeated hostnames are cheap to
+        extract. Set it to 0 to disable this in-memory cache.
         """
         suffix_list_urls = suffix_list_urls or ()
         self.suffix_list_urls = tuple(
@@ -208,6 +239,10 @@ class TLDExtract:
         self.include_psl_private_domains = include_psl_private_domains
         self.extra_suffixes = extra_suffixes
         self._extractor: _PublicSuffixListTLDExtractor | None = None
+        self._extractor_lock = threading.Lock()
+        self.netloc_cache_size = netloc_cache_size
+        # Real-world inputs repeat hostnames heavily, so memoize recent splits
+        self._split_netloc = _make_netloc_cache(self, netloc_cache_size)
 
         self.cache_fetch_timeout = (
             float(cache_fetch_timeout)
@@ -216,6 +251,23 @@ class TLDExtract:
         )
         self._cache = DiskCache(cache_dir)
 
+    def __getstate__(self) -> dict[str, object]:
+        """Pickle everything but the lock and the in-memory cache.
+
+        The parsed suffix list is kept, so unpickling, e.g. in a process pool
+        worker, doesn't read or fetch it again.
+        """
+        state = self.__dict__.copy()
+        del state["_extractor_lock"]
+        del state["_split_netloc"]
+        return state
+
+    def __setstate__(self, state: dict[str, object]) -> None:
+        """Restore a pickled instance, with a fresh lock and in-memory cache."""
+        self.__dict__.update(state)
+        self._extractor_lock = threading.Lock()
+        self._split_netloc = _make_netloc_cache(self, self.netloc_cache_size)
+
     def __call__(
         self,
         url: str,
@@ -286,11 +338,15 @@ class TLDExtract:
         include_psl_private_domains: bool | None,
         session: requests.Session | None = None,
     ) -> ExtractResult:
-        netloc_with_ascii_dots = (
-            netloc.replace("\u3002", "\u002e")
-            .replace("\uff0e", "\u002e")
-            .replace("\uff61", "\u002e")
-        )
+        if netloc.isascii():
+            # The unicode full stops are non-ASCII, so there's nothing to replace
+            netloc_with_ascii_dots = netloc
+        else:
+            netloc_with_ascii_dots = (
+                netloc.replace("\u3002", "\u002e")
+                .replace("\uff0e", "\u002e")
+                .replace("\uff61", "\u002e")
+            )
 
         min_num_ipv6_chars = 4
         if (
@@ -301,22 +357,30 @@ class TLDExtract:
         ):
             return ExtractResult("", netloc_with_ascii_dots, "", is_private=False)
 
-        labels = netloc_with_ascii_dots.split(".")
+        if self._extractor is None:
+            self._get_tld_extractor(session=session)
+        return ExtractResult(
+            *self._split_netloc(netloc_with_ascii_dots, include_psl_private_domains)
+        )
 
-        suffix_index, is_private = self._get_tld_extractor(
-            session=session
-        ).suffix_index(labels, include_psl_private_domains=include_psl_private_domains)
+    def _split_netloc_uncached(
+        self, netloc: str, include_psl_private_domains: bool | None
+    ) -> tuple[str, str, str, bool]:
+        labels = netloc.split(".")
+
+        extractor = self._extractor or self._get_tld_extractor()
+        suffix_index, is_private = extractor.suffix_index(
+            labels, include_psl_private_domains=include_psl_private_domains
+        )
 
         num_ipv4_labels = 4
-        if suffix_index == len(labels) == num_ipv4_labels and looks_like_ip(
-            netloc_with_ascii_dots
-        ):
-            return ExtractResult("", netloc_with_ascii_dots, "", is_private)
+        if suffix_index == len(labels) == num_ipv4_labels and looks_like_ip(netloc):
+            return "", netloc, "", is_private
 
         suffix = ".".join(labels[suffix_index:]) if suffix_index != len(labels) else ""
         subdomain = ".".join(labels[: suffix_index - 1]) if suffix_index >= 2 else ""
         domain = labels[suffix_index - 1] if suffix_index else ""
-        return ExtractResult(subdomain, domain, suffix, is_private)
+        return subdomain, domain, suffix, is_private
 
     def update(
         self, fetch_now: bool = False, session: requests.Session | None = None
@@ -324,6 +388,7 @@ class TLDExtract:
         """Force fetch the latest suffix list definitions."""
         self._extractor = None
         self._cache.clear()
+        self._split_netloc.cache_clear()
         if fetch_now:
             self._get_tld_extractor(session=session)
 
@@ -351,6 +416,14 @@ class TLDExtract:
         if self._extractor:
             return self._extractor
 
+        with self._extractor_lock:
+            if self._extractor is None:
+                self._extractor = self._build_tld_extractor(session=session)
+            return self._extractor
+
+    def _build_tld_extractor(
+        self, session: requests.Session | None = None
+    ) -> _PublicSuffixListTLDExtractor:
         public_tlds, private_tlds = get_suffix_lists(
             cache=self._cache,
             urls=self.suffix_list_urls,
@@ -362,13 +435,12 @@ class TLDExtract:
         if not any([public_tlds, private_tlds, self.extra_suffixes]):
             raise ValueError("No tlds set. Cannot proceed without tlds.")
 
-        self._extractor = _PublicSuffixListTLDExtractor(
+        return _PublicSuffixListTLDExtractor(
             public_tlds=public_tlds,
             private_tlds=private_tlds,
             extra_tlds=list(self.extra_suffixes),
             include_psl_private_domains=self.include_psl_private_domains,
         )
-        return self._extractor
 
 
 TLD_EXTRACTOR = TLDExtract()
@@ -377,6 +449,8 @@ TLD_EXTRACTOR = TLDExtract()
 class Trie:
     """Trie for storing eTLDs with their labels in reverse-order."""
 
+    __slots__ = ("matches", "end", "is_private", "has_public")
+
     def __init__(
         self,
         matches: dict[str, Trie] | None = None,
@@ -387,6 +461,9 @@ class Trie:
         self.matches = matches if matches else {}
         self.end = end
         self.is_private = is_private
+        # Whether a public rule ends at or below this node. Lookups that
+        # exclude private domains must not descend into private-only branches.
+        self.has_public = False
 
     @staticmethod
     def create(
@@ -408,19 +485,29 @@ class Trie:
         return root_node
 
     def add_suffix(self, suffix: str, is_private: bool = False) -> None:
-        """Append a suffix's labels to this Trie node."""
+        """Append a suffix's labels to this Trie node.
+
+        Labels are lowercased once here, so lookups only need to lowercase
+        the user's input.
+        """
         node = self
 
-        labels = suffix.split(".")
+        labels = suffix.lower().split(".")
         labels.reverse()
 
         for label in labels:
             if label not in node.matches:
                 node.matches[label] = Trie()
             node = node.matches[label]
+            if not is_private:
+                node.has_public = True
 
-        node.end = True
-        node.is_private = is_private
+        if node.end:
+            # Listed as both public and private, e.g. via extra_suffixes
+            node.is_private = node.is_private and is_private
+        else:
+            node.end = True
+            node.is_private = is_private
 
 
 @wraps(TLD_EXTRACTOR.__call__)
@@ -455,10 +542,7 @@ class _PublicSuffixListTLDExtractor:
         self.private_tlds = private_tlds
         self.tlds_incl_private = frozenset(public_tlds + private_tlds + extra_tlds)
         self.tlds_excl_private = frozenset(public_tlds + extra_tlds)
-        self.tlds_incl_private_trie = Trie.create(
-            self.tlds_excl_private, frozenset(private_tlds)
-        )
-        self.tlds_excl_private_trie = Trie.create(self.tlds_excl_private)
+        self.tlds_trie = Trie.create(self.tlds_excl_private, frozenset(private_tlds))
 
     def tlds(self, include_psl_private_domains: bool | None = None) -> frozenset[str]:
         """Get the currently filtered list of suffixes."""
@@ -481,40 +565,52 @@ class _PublicSuffixListTLDExtractor:
         if include_psl_private_domains is None:
             include_psl_private_domains = self.include_psl_private_domains
 
-        node = (
-            self.tlds_incl_private_trie
-            if include_psl_private_domains
-            else self.tlds_excl_private_trie
-        )
+        node = self.tlds_trie
         i = len(spl)
         j = i
+        is_private = False
         for label in reversed(spl):
             decoded_label = _decode_punycode(label)
-            if decoded_label in node.matches:
+            child = node.matches.get(decoded_label)
+            if child is not None and (include_psl_private_domains or child.has_public):
                 j -= 1
-                node = node.matches[decoded_label]
-                if node.end:
+                node = child
+                if node.end and (include_psl_private_domains or not node.is_private):
                     i = j
+                    is_private = node.is_private
                 continue
 
-            is_wildcard = "*" in node.matches
-            if is_wildcard:
-                is_wildcard_exception = "!" + decoded_label in node.matches
-                if is_wildcard_exception:
-                    return j, node.matches["*"].is_private
-                return j - 1, node.matches["*"].is_private
+            wildcard = node.matches.get("*")
+            if wildcard is not None and (
+                include_psl_private_domains or wildcard.has_public
+            ):
+                is_wildcard_private = (
+                    include_psl_private_domains and wildcard.is_private
+                )
+                exception = node.matches.get("!" + decoded_label)
+                if exception is not None and (
+                    include_psl_private_domains or exception.has_public
+                ):
+                    return j, is_wildcard_private
+                return j - 1, is_wildcard_private
 
             break
 
-        return i, node.is_private
+        return i, is_private
 
 
 def _decode_punycode(label: str) -> str:
-    lowered = label.lower()
+    lowered = label if label.isascii() and label.islower() else label.lower()
     looks_like_puny = lowered.startswith("xn--")
     if looks_like_puny:
-        try:
-            return idna.decode(lowered)
-        except (UnicodeError, IndexError):
-            pass
+        return _decode_idna(lowered)
     return lowered
+
+
+@lru_cache(maxsize=1024)
+def _decode_idna(label: str) -> str:
+    """Decode a punycode label, memoized since IDNA 2008 decoding is slow."""
+    try:
+        return idna.decode(label)
+    except (UnicodeError, IndexError):
+        return label